@@ -1,7 +1,10 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.contrib.auth.hashers import make_password
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from .models import User, Organization, Project, Assignment
+from .passwords import invalidate_project_password
 
 
 @admin.register(User)
@@ -13,6 +16,9 @@ class CustomUserAdmin(UserAdmin):
     )
     list_filter = ('role', 'organization', 'is_active', 'is_staff')
     search_fields = ('username', 'email', 'first_name', 'last_name')
+    list_select_related = ('organization',)
+    autocomplete_fields = ('organization',)
+    show_full_result_count = False
     
     fieldsets = UserAdmin.fieldsets + (
         ('Custom Fields', {
@@ -36,14 +42,19 @@ class OrganizationAdmin(admin.ModelAdmin):
     )
     search_fields = ('name', 'description')
     readonly_fields = ('created_at', 'updated_at')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_counts()
     
     def get_projects_count(self, obj):
-        return obj.projects.count()
+        return obj.projects_count
     get_projects_count.short_description = 'Projects'
+    get_projects_count.admin_order_field = 'projects_count'
     
     def get_users_count(self, obj):
-        return obj.user_set.count()
+        return obj.users_count
     get_users_count.short_description = 'Users'
+    get_users_count.admin_order_field = 'users_count'
 
 
 @admin.register(Project)
@@ -56,6 +67,9 @@ class ProjectAdmin(admin.ModelAdmin):
     list_filter = ('organization', 'is_active', 'created_at')
     search_fields = ('name', 'description', 'organization__name')
     readonly_fields = ('created_at', 'updated_at')
+    list_select_related = ('organization', 'created_by')
+    autocomplete_fields = ('organization', 'created_by')
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -77,7 +91,10 @@ class ProjectAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         """Override save to hash password if it's not already hashed"""
         if 'password' in form.changed_data:
-            if not obj.password.startswith('pbkdf2_'):
+            invalidate_project_password(form.initial.get('password'))
+            try:
+                identify_hasher(obj.password)
+            except ValueError:
                 obj.password = make_password(obj.password)
         
         if not change and not obj.created_by_id:
@@ -85,9 +102,16 @@ class ProjectAdmin(admin.ModelAdmin):
         
         super().save_model(request, obj, form, change)
     
+    def get_queryset(self, request):
+        # Read the ProjectStats rollup (one joined row) instead of counting
+        return super().get_queryset(request).annotate(
+            assignments_count=Coalesce('stats__assignments_count', Value(0))
+        )
+
     def get_assignments_count(self, obj):
-        return obj.assignments.count()
+        return obj.assignments_count
     get_assignments_count.short_description = 'Assignments'
+    get_assignments_count.admin_order_field = 'assignments_count'
 
 
 @admin.register(Assignment)
@@ -102,6 +126,8 @@ class AssignmentAdmin(admin.ModelAdmin):
         'staff__username', 'project__name', 'assigned_by__username'
     )
     readonly_fields = ('assigned_at', 'unlocked_at')
+    autocomplete_fields = ('staff', 'project', 'assigned_by')
+    show_full_result_count = False
     
     fieldsets = (
         ('Assignment Details', {
@@ -0,0 +1,159 @@
+"""Async versions of the read-only list endpoints for ASGI deployments
+
+They keep the API's response shapes: cursor pagination, the response
+cache, its ETags and DRF's error bodies. Only the authentication lookup
+uses the async ORM. In Django 4.2 the async ORM methods (aaggregate,
+acount, ...) run the sync query through sync_to_async on one shared
+thread, and DRF pagination and serialization are sync anyway, so every
+other read, the change marker included, runs on a pool thread instead
+(see _read). That keeps requests parallel, but it is not a true async
+ORM; expect throughput on par with WSGI threads (see config/asgi.py).
+"""
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connection
+from django.http import HttpResponse, HttpResponseNotAllowed
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.views import exception_handler
+
+from .authentication import CachedJWTAuthentication
+from .cache import cached_response, conditional_response
+from .instrumentation import recording_queries
+from .models import User, Project, Assignment
+from .pagination import paginated_response
+from .serializers import (
+    UserSerializer, ProjectDetailSerializer,
+    AssignmentDetailSerializer, NormalizedAssignmentSerializer,
+)
+
+authenticator = CachedJWTAuthentication()
+
+
+def _render(data, status_code=status.HTTP_200_OK, headers=None):
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    response = HttpResponse(
+        renderer.render(data), status=status_code, content_type='application/json'
+    )
+    for name, value in (headers or {}).items():
+        response[name] = value
+    return response
+
+
+def _error_response(exc):
+    """Render an APIException as DRF's exception handler would"""
+    response = exception_handler(exc, {})
+    headers = {
+        name: value for name, value in response.items() if name.lower() != 'content-type'
+    }
+    return _render(response.data, response.status_code, headers)
+
+
+async def _read(func, *args):
+    """Run read-only sync work on a pool thread with its own connection
+
+    Default (thread-sensitive) sync_to_async sends every call through one
+    shared thread, so a worker would serve one request at a time. These
+    reads need no transaction, so they can run in parallel; connections
+    are closed per call the way Django closes them per request. Queries
+    count towards the request's instrumentation, whose context variable
+    sync_to_async carries over to the pool thread.
+    """
+    def run():
+        close_old_connections()
+        try:
+            with recording_queries(connection):
+                return func(*args)
+        except exceptions.APIException as exc:
+            return _error_response(exc)
+        finally:
+            close_old_connections()
+
+    return await sync_to_async(run, thread_sensitive=False)()
+
+
+async def _authenticate(request):
+    """Return (drf_request, None) for an authenticated GET, else (None, error_response)"""
+    if request.method != 'GET':
+        return None, HttpResponseNotAllowed(['GET'])
+
+    drf_request = Request(request)
+    try:
+        result = await authenticator.aauthenticate(drf_request)
+    except exceptions.AuthenticationFailed as exc:
+        detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return None, _render(
+            detail, exc.status_code,
+            {'WWW-Authenticate': authenticator.authenticate_header(drf_request)}
+        )
+    if result is None:
+        return None, _render(
+            {'detail': exceptions.NotAuthenticated.default_detail},
+            status.HTTP_401_UNAUTHORIZED,
+            {'WWW-Authenticate': authenticator.authenticate_header(drf_request)}
+        )
+
+    drf_request.user, drf_request.auth = result
+    return drf_request, None
+
+
+async def staff_list(request):
+    """Get all staff members"""
+    drf_request, error = await _authenticate(request)
+    if error is not None:
+        return error
+    if drf_request.user.role != 'admin':
+        return _render({'error': 'Only admins can view staff'}, status.HTTP_403_FORBIDDEN)
+
+    staff = User.objects.filter(
+        role='staff',
+        is_active=True
+    )
+
+    return await _read(cached_response, drf_request, lambda: paginated_response(
+        drf_request, staff, UserSerializer, ('username', 'id')
+    ))
+
+
+async def projects_list(request):
+    """Get all projects"""
+    drf_request, error = await _authenticate(request)
+    if error is not None:
+        return error
+    if drf_request.user.role != 'admin':
+        return _render({'error': 'Only admins can view projects'}, status.HTTP_403_FORBIDDEN)
+
+    projects = Project.objects.filter(
+        is_active=True
+    )
+
+    return await _read(cached_response, drf_request, lambda: paginated_response(
+        drf_request, projects, ProjectDetailSerializer, ('-created_at', '-id')
+    ))
+
+
+async def my_assignments(request):
+    """Get current user's assignments (for staff, ?view=normalized for side-loaded objects)"""
+    drf_request, error = await _authenticate(request)
+    if error is not None:
+        return error
+    if drf_request.user.role != 'staff':
+        return _render(
+            {'error': 'Only staff can view their assignments'}, status.HTTP_403_FORBIDDEN
+        )
+
+    assignments = Assignment.objects.filter(staff=drf_request.user)
+    if drf_request.query_params.get('view') == 'normalized':
+        serializer_class = NormalizedAssignmentSerializer
+    else:
+        serializer_class = AssignmentDetailSerializer
+
+    def respond():
+        token, last_modified = assignments.change_marker()
+        return conditional_response(
+            drf_request, token, last_modified, lambda: paginated_response(
+                drf_request, assignments, serializer_class, ('-assigned_at', '-id')
+            )
+        )
+
+    return await _read(respond)
@@ -0,0 +1,118 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# The only User columns the API views read from request.user, listed in
+# model field order because Model.from_db assigns partial rows in that order
+CACHED_USER_FIELDS = ('id', 'username', 'is_active', 'role', 'organization_id')
+
+# (user_id, version) -> (expires_at, values)
+_users = OrderedDict()
+_lock = threading.Lock()
+
+
+def _version_key(user_id):
+    return f'core:user-version:{user_id}'
+
+
+def get_user_version(user_id):
+    """Current version stamp of a user, shared through the 'auth' cache"""
+    cache = caches['auth']
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_user_version(user_id):
+    """Invalidate every cached copy of a user (called once a User change commits)"""
+    caches['auth'].set(_version_key(user_id), uuid.uuid4().hex, None)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that keeps recently seen users in process memory
+
+    Entries are keyed by a per-user version stamp, so saving or deactivating
+    a user takes effect on the next request once the change commits. The
+    stamps live in the 'auth' cache, which must be shared by all workers
+    (CACHE_BACKEND=file, the default, or a network cache) and hold one
+    stamp per active user: a culled stamp is a miss here.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares against the password hash, which is not cached
+            return super().get_user(validated_token)
+
+        user_id, key, values = self._cached_values(validated_token)
+        if values is None:
+            values = self._user_values(user_id).first()
+            self._store(key, values)
+        return self._build_user(values)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views; cache misses use the async ORM"""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return await sync_to_async(super().get_user)(validated_token), validated_token
+
+        user_id, key, values = self._cached_values(validated_token)
+        if values is None:
+            values = await self._user_values(user_id).afirst()
+            self._store(key, values)
+        return self._build_user(values), validated_token
+
+    def _cached_values(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = (user_id, get_user_version(user_id))
+        with _lock:
+            entry = _users.get(key)
+            if entry is None:
+                return user_id, key, None
+            if entry[0] <= time.monotonic():
+                del _users[key]
+                return user_id, key, None
+            return user_id, key, entry[1]
+
+    def _user_values(self, user_id):
+        return self.user_model.objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        ).values_list(*CACHED_USER_FIELDS)
+
+    def _store(self, key, values):
+        if values is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        with _lock:
+            _users[key] = (time.monotonic() + settings.AUTH_USER_CACHE_TTL, values)
+            while len(_users) > settings.AUTH_USER_CACHE_SIZE:
+                _users.popitem(last=False)
+
+    def _build_user(self, values):
+        # Columns outside CACHED_USER_FIELDS stay deferred and load on access
+        user = self.user_model.from_db(DEFAULT_DB_ALIAS, CACHED_USER_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,94 @@
+import hashlib
+import uuid
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from rest_framework.settings import api_settings
+
+GENERATION_KEY = 'generation'
+
+
+def get_generation():
+    """Current generation of the API response cache"""
+    cache = caches['api']
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    """Make every cached API response stale (run once model writes commit)"""
+    caches['api'].set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def _etag_matches(request, etag):
+    # Weak comparison: CompressionMiddleware sends our tags back as W/"..."
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return etag in (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))
+
+
+def _render(data):
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return renderer.render(data)
+
+
+def cached_response(request, build_response):
+    """Serve a list endpoint from the API cache, or build and store it
+
+    Entries are keyed by host, path and sorted query string and tagged with
+    the cache generation, so any write to a core model retires them all.
+    Clients sending a matching If-None-Match get a 304 without a body.
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    key = hashlib.sha256(
+        f'{request.get_host()}{request.path}?{query}'.encode()
+    ).hexdigest()
+    generation = get_generation()
+    etag = f'"{generation}-{key[:16]}"'
+
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        cache = caches['api']
+        cache_key = f'{key}:{generation}'
+        content = cache.get(cache_key)
+        if content is None:
+            content = _render(build_response().data)
+            cache.set(cache_key, content)
+        response = HttpResponse(content, content_type='application/json')
+
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_response(request, token, last_modified, build_response):
+    """Answer a matching If-None-Match with a 304 before building the response
+
+    ``token`` describes the current state of the data, e.g. from
+    AssignmentQuerySet.change_marker(). The ETag also covers the user and
+    query string, so pages and users never share a tag. Last-Modified is
+    informational: only If-None-Match is honoured, since a removed row
+    does not move the timestamp forward.
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    key = hashlib.sha256(
+        f'{request.user.pk}:{request.path}?{query}:{token}'.encode()
+    ).hexdigest()
+    etag = f'"{key[:32]}"'
+
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(_render(build_response().data), content_type='application/json')
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,36 @@
+import os
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class FileCache(FileBasedCache):
+    """FileBasedCache that culls expired entries first, then the oldest ones
+
+    Django's file cache deletes a random third of its entries once
+    MAX_ENTRIES is reached, live ones included. Throttle histories and
+    user version stamps must not vanish at random, so this backend only
+    drops live entries when expired ones do not free enough room, and then
+    the least recently written first.
+    """
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        if len(filelist) < self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            return self.clear()
+
+        live = []
+        for fname in filelist:
+            try:
+                with open(fname, 'rb') as f:
+                    if self._is_expired(f):
+                        continue
+                live.append((os.path.getmtime(fname), fname))
+            except FileNotFoundError:
+                pass
+        if len(live) < self._max_entries:
+            return
+        live.sort()
+        for _, fname in live[:len(live) // self._cull_frequency]:
+            self._delete(fname)
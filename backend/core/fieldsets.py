@@ -0,0 +1,147 @@
+"""Sparse fieldsets: ?fields= and ?expand= for the core serializers
+
+``?fields=id,project.name`` keeps only the listed fields; dotted paths
+reach into nested objects. ``?expand=project`` renders only the listed
+nested objects in full and the others as their primary key. Without
+``?expand=`` every nested object is expanded, as before.
+
+narrow_queryset() turns the resulting field tree into ``only()``,
+``select_related()`` and ``prefetch_related()`` calls, so columns and
+joins nobody asked for are never loaded.
+"""
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def parse_paths(value):
+    """'a,b.c' -> {'a': {}, 'b': {'c': {}}}"""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for part in path.strip().split('.'):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+class DynamicFieldsMixin:
+    """ModelSerializer mixin that prunes fields per request
+
+    The root serializer reads ?fields= and ?expand= from the GET request in
+    its context; ``fields`` and ``expand`` trees (see parse_paths) can also
+    be passed to the constructor. ``annotated_fields`` lists the fields read
+    from a ``with_counts()`` annotation.
+    """
+    annotated_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        self.selected_fields = kwargs.pop('fields', None)
+        self.expanded_fields = kwargs.pop('expand', None)
+        super().__init__(*args, **kwargs)
+
+    def _selection(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get('request')
+        if (parent is None and self.selected_fields is None and self.expanded_fields is None
+                and request is not None and request.method == 'GET'):
+            params = request.query_params
+            return (
+                parse_paths(params['fields']) if 'fields' in params else None,
+                parse_paths(params['expand']) if 'expand' in params else None,
+            )
+        return self.selected_fields, self.expanded_fields
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected, expand = self._selection()
+        if selected:
+            for name in list(fields):
+                if name not in selected:
+                    del fields[name]
+
+        for name, field in fields.items():
+            if not isinstance(field, serializers.BaseSerializer):
+                continue
+            subfields = selected.get(name) if selected else None
+            if expand is not None and name not in expand and not subfields:
+                fields[name] = serializers.PrimaryKeyRelatedField(
+                    read_only=True, source=field.source
+                )
+            elif isinstance(field, DynamicFieldsMixin):
+                field.selected_fields = subfields or None
+                field.expanded_fields = expand.get(name, {}) if expand is not None else None
+        return fields
+
+    def needs_annotations(self):
+        return any(name in self.fields for name in self.annotated_fields)
+
+
+class _Plan:
+    def __init__(self):
+        self.only = set()
+        self.related = set()
+        self.prefetch = {}
+
+
+def _collect(serializer, prefix, plan):
+    plan.only.add(prefix + serializer.Meta.model._meta.pk.name)
+    for field in serializer._readable_fields:
+        if field.source == '*' or isinstance(field, serializers.SerializerMethodField):
+            continue
+        attrs = field.source_attrs
+        # Every relation along a dotted source is joined in
+        for i in range(1, len(attrs)):
+            relation = prefix + '__'.join(attrs[:i])
+            plan.only.add(relation)
+            plan.related.add(relation)
+        path = prefix + '__'.join(attrs)
+        plan.only.add(path)
+
+        if isinstance(field, DynamicFieldsMixin):
+            if field.needs_annotations():
+                # Annotations cannot ride on a join, so load the relation separately
+                plan.prefetch[path] = field
+            else:
+                plan.related.add(path)
+                _collect(field, path + '__', plan)
+
+
+def _narrow(queryset, serializer, only=(), related=()):
+    plan = _Plan()
+    plan.only.update(only)
+    plan.related.update(related)
+    _collect(serializer, '', plan)
+
+    prefetches = []
+    for path, nested in sorted(plan.prefetch.items()):
+        # Whatever the parent reads through a prefetched relation is loaded
+        # by the prefetch query; a join here would win and drop its annotations
+        inside = path + '__'
+        nested_only = {o for o in plan.only if o.startswith(inside)}
+        nested_related = {r for r in plan.related if r.startswith(inside)}
+        plan.only -= nested_only
+        plan.related -= nested_related | {path}
+        prefetches.append(Prefetch(path, queryset=_narrow(
+            nested.Meta.model._default_manager.all(), nested,
+            [o[len(inside):] for o in nested_only],
+            [r[len(inside):] for r in nested_related],
+        )))
+
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if serializer.needs_annotations():
+        queryset = queryset.with_counts()
+    if plan.related:
+        # select_related() without arguments would follow every relation
+        queryset = queryset.select_related(*sorted(plan.related))
+    return queryset.prefetch_related(*prefetches).only(*plan.only)
+
+
+def narrow_queryset(queryset, serializer, ordering=()):
+    """Load only the columns and relations ``serializer`` reads
+
+    Existing select_related/prefetch_related calls are replaced. Columns
+    named in ``ordering`` are kept so cursor pagination can read them.
+    """
+    return _narrow(queryset, serializer, [name.lstrip('-') for name in ordering])
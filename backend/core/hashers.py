@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth.hashers import ScryptPasswordHasher
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt with cost parameters from settings.SCRYPT_PARAMS
+
+    Uses the stock ``scrypt`` algorithm name, so hashes stay verifiable by
+    Django's own hasher; changing the parameters rehashes on next login.
+    """
+    work_factor = settings.SCRYPT_PARAMS['work_factor']
+    block_size = settings.SCRYPT_PARAMS['block_size']
+    parallelism = settings.SCRYPT_PARAMS['parallelism']
+    maxmem = settings.SCRYPT_PARAMS['maxmem']
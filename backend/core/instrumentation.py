@@ -0,0 +1,65 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Query and timing totals collected for one sampled request"""
+
+    def __init__(self, keep_sql=False):
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.timings = {}
+        self.keep_sql = keep_sql
+        self.queries = []
+
+    def record_query(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.query_count += 1
+            self.sql_seconds += elapsed
+            if self.keep_sql:
+                self.queries.append((round(elapsed * 1000, 3), sql))
+
+
+def start_request(metrics):
+    return _current.set(metrics)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+@contextmanager
+def recording_queries(connection):
+    """Count the block's queries on ``connection`` towards the current request
+
+    RequestInstrumentationMiddleware wraps its own thread's connection; work
+    moved to another thread (e.g. core.async_views._read) uses this there.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    with connection.execute_wrapper(metrics.record_query):
+        yield
+
+
+@contextmanager
+def timed(name):
+    """Add the duration of the block to the current request's ``name`` timing"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] = metrics.timings.get(name, 0.0) + time.perf_counter() - start
@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from core.management.commands.generate_load_data import (
+    generate_assignments, scratch_database,
+)
+from core.models import Assignment
+from core.serializers import (
+    AssignmentDetailSerializer, CompactAssignmentSerializer, NormalizedAssignmentSerializer,
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare rows/second and payload size of the assignment serializers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            counts = generate_assignments(options['rows'])
+            self.stdout.write(f'Seeded {counts["assignments"]} assignments')
+            self.run(options['repeat'])
+
+    def run(self, repeat):
+        def normalized():
+            serializer = NormalizedAssignmentSerializer(
+                list(Assignment.objects.order_by('-assigned_at', '-id')), many=True
+            )
+            return {'results': serializer.data, **serializer.included}
+
+        modes = {
+            'nested': lambda: {'results': AssignmentDetailSerializer(
+                list(Assignment.objects.with_details().order_by('-assigned_at', '-id')),
+                many=True
+            ).data},
+            'compact': lambda: {'results': CompactAssignmentSerializer(
+                list(Assignment.objects.values(*CompactAssignmentSerializer.columns)
+                     .order_by('-assigned_at', '-id')),
+                many=True
+            ).data},
+            'normalized': normalized,
+        }
+        renderer = JSONRenderer()
+        for name, build in modes.items():
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                data = build()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            rows = len(data['results'])
+            size = len(renderer.render(data))
+            self.stdout.write(
+                f'{name:>10}: {rows / best:,.0f} rows/s (best of {repeat}, {best * 1000:.1f} ms), '
+                f'{size / 1024:,.0f} KB JSON'
+            )
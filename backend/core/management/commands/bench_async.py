@@ -0,0 +1,114 @@
+import asyncio
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.client import AsyncClient
+from django.test.utils import override_settings
+from django.urls import clear_url_caches
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.cache import bump_generation
+from core.management.commands.generate_load_data import generate, scratch_database
+from core.models import User
+
+
+def _use_async_views(enabled):
+    """Re-resolve the URLconf with ASYNC_READ_VIEWS switched on or off"""
+    import config.urls
+    import core.urls
+    with override_settings(ASYNC_READ_VIEWS=enabled):
+        importlib.reload(core.urls)
+        importlib.reload(config.urls)
+    clear_url_caches()
+
+
+class Command(BaseCommand):
+    help = 'Compare sync (WSGI) and async (ASGI) read endpoint throughput under DB latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=300)
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--latency-ms', type=float, default=5.0,
+                            help='Simulated network round trip added to every SQL query')
+        parser.add_argument('--size', type=int, default=2000, help='Approximate assignment count')
+
+    def handle(self, *args, **options):
+        latency = options['latency_ms'] / 1000
+
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            # A reconnect reuses the wrapper object, so add the delay once
+            if slow_query not in connection.execute_wrappers:
+                connection.execute_wrappers.append(slow_query)
+
+        with scratch_database():
+            generate(
+                orgs=1, users_per_org=1 + options['size'] // 10,
+                projects_per_org=20, density=0.5, prefix='bench',
+            )
+            admin = User.objects.filter(role='admin').first()
+            staff = User.objects.filter(role='staff', assignments__isnull=False).first()
+            targets = [
+                ('/api/staff/', admin), ('/api/projects/', admin),
+                ('/api/my-assignments/', staff),
+            ]
+            headers = {
+                user.pk: f'Bearer {RefreshToken.for_user(user).access_token}'
+                for _, user in targets
+            }
+            plan = [targets[i % len(targets)] for i in range(options['requests'])]
+
+            connection_created.connect(add_latency)
+            connections.close_all()
+            try:
+                _use_async_views(False)
+                sync_elapsed = self.run_sync(plan, headers, options['concurrency'])
+                _use_async_views(True)
+                async_elapsed = asyncio.run(
+                    self.run_async(plan, headers, options['concurrency'])
+                )
+            finally:
+                connection_created.disconnect(add_latency)
+                _use_async_views(settings.ASYNC_READ_VIEWS)
+
+        total = options['requests']
+        self.stdout.write(
+            f'{total} requests, concurrency {options["concurrency"]}, '
+            f'{options["latency_ms"]} ms per query'
+        )
+        self.stdout.write(f' sync (WSGI threads): {total / sync_elapsed:8.1f} req/s')
+        self.stdout.write(f'async (ASGI tasks):   {total / async_elapsed:8.1f} req/s')
+
+    def run_sync(self, plan, headers, concurrency):
+        def send(target):
+            path, user = target
+            bump_generation()
+            response = Client().get(path, HTTP_AUTHORIZATION=headers[user.pk])
+            connections.close_all()
+            assert response.status_code == 200, response.content
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(send, plan))
+        return time.perf_counter() - start
+
+    async def run_async(self, plan, headers, concurrency):
+        limit = asyncio.Semaphore(concurrency)
+        client = AsyncClient()
+
+        async def send(target):
+            path, user = target
+            async with limit:
+                bump_generation()
+                response = await client.get(path, headers={'Authorization': headers[user.pk]})
+            assert response.status_code == 200, response.content
+        start = time.perf_counter()
+        await asyncio.gather(*(send(target) for target in plan))
+        return time.perf_counter() - start
@@ -0,0 +1,54 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+from core.management.commands.generate_load_data import scratch_database
+from core.models import User
+
+
+class Command(BaseCommand):
+    help = 'Measure single-core login throughput for each configured password hasher'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=20)
+        parser.add_argument('--hashers', default=','.join(settings.PASSWORD_HASHER_CHOICES))
+
+    def handle(self, *args, **options):
+        names = options['hashers'].split(',')
+        for name in names:
+            if name not in settings.PASSWORD_HASHER_CHOICES:
+                raise CommandError(f'Unknown hasher: {name}')
+
+        with scratch_database():
+            for name in names:
+                preferred = settings.PASSWORD_HASHER_CHOICES[name]
+                hashers = [preferred] + [h for h in settings.PASSWORD_HASHERS if h != preferred]
+                with override_settings(PASSWORD_HASHERS=hashers):
+                    try:
+                        rate = self.measure(name, options['logins'])
+                    except ValueError as exc:
+                        # e.g. argon2 without argon2-cffi installed
+                        self.stdout.write(f'{name:>8}: skipped ({exc})')
+                        continue
+                self.stdout.write(f'{name:>8}: {rate:7.1f} logins/s per core')
+
+    def measure(self, name, logins):
+        username = f'bench-{name}'
+        user = User(username=username, role='staff')
+        user.set_password('password')
+        user.save()
+
+        client = APIClient()
+        start = time.perf_counter()
+        for _ in range(logins):
+            # Repeated logins for one username would otherwise be throttled
+            caches['throttle'].clear()
+            response = client.post(
+                '/api/login/', {'username': username, 'password': 'password'}, format='json'
+            )
+            if response.status_code != 200:
+                raise CommandError(f'Login failed: {response.content[:200]}')
+        return logins / (time.perf_counter() - start)
@@ -0,0 +1,79 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from core.management.commands.generate_load_data import (
+    generate_assignments, scratch_database,
+)
+from core.middleware import CompressionMiddleware
+from core.models import Assignment
+from core.renderers import OrjsonRenderer, orjson
+from core.serializers import AssignmentDetailSerializer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _best(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+class Command(BaseCommand):
+    help = 'Compare JSON encode time and compressed size of an assignments_list payload'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            counts = generate_assignments(options['rows'])
+            self.stdout.write(f'Seeded {counts["assignments"]} assignments')
+            data = {'results': AssignmentDetailSerializer(
+                Assignment.objects.with_details().order_by('-assigned_at', '-id'), many=True
+            ).data}
+        self.run(data, options['repeat'])
+
+    def run(self, data, repeat):
+        renderers = {'stdlib': JSONRenderer()}
+        if orjson is not None:
+            renderers['orjson'] = OrjsonRenderer()
+        else:
+            self.stdout.write('orjson not installed, skipping it')
+
+        body = None
+        for name, renderer in renderers.items():
+            seconds, body = _best(repeat, lambda: renderer.render(data))
+            self.stdout.write(
+                f'{name:>8}: encode {seconds * 1000:8.1f} ms, {len(body) / 1024:,.0f} KB'
+            )
+
+        codecs = {
+            # What CompressionMiddleware sends, via Django's GZipMiddleware
+            'gzip': lambda: compress_string(
+                body, max_random_bytes=CompressionMiddleware.max_random_bytes
+            ),
+        }
+        if brotli is not None:
+            codecs['br'] = lambda: brotli.compress(
+                body, quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            self.stdout.write('brotli not installed, skipping it')
+        for name, compress in codecs.items():
+            seconds, compressed = _best(repeat, compress)
+            self.stdout.write(
+                f'{name:>8}: compress {seconds * 1000:6.1f} ms, '
+                f'{len(compressed) / 1024:,.0f} KB on the wire '
+                f'({len(compressed) / len(body):.1%} of {len(body) / 1024:,.0f} KB)'
+            )
@@ -0,0 +1,104 @@
+import multiprocessing
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from core.management.commands.generate_load_data import generate
+from core.models import User, Project, Assignment
+
+
+def _worker(pairs, admin_id, pragmas, conn_max_age, results):
+    """Insert one assignment per pair and unlock it, like assign + unlock requests"""
+    settings.SQLITE_PRAGMAS = pragmas
+    done = locked = 0
+    for staff_id, project_id in pairs:
+        try:
+            with transaction.atomic():
+                assignment = Assignment.objects.create(
+                    staff_id=staff_id, project_id=project_id, assigned_by_id=admin_id
+                )
+            assignment.unlock()
+            done += 1
+        except OperationalError as exc:
+            if 'locked' not in str(exc):
+                raise
+            locked += 1
+        if not conn_max_age:
+            # Without persistent connections every request opens a new one
+            connection.close()
+    connection.close()
+    results.put((done, locked))
+
+
+class Command(BaseCommand):
+    help = 'Measure multi-process SQLite write throughput for each SQLITE_PROFILES entry'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument('--writes-per-worker', type=int, default=200)
+        parser.add_argument('--profiles', default=','.join(settings.SQLITE_PROFILES))
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('This benchmark only applies to SQLite')
+        profiles = options['profiles'].split(',')
+        for name in profiles:
+            if name not in settings.SQLITE_PROFILES:
+                raise CommandError(f'Unknown SQLite profile: {name}')
+
+        workers = options['workers']
+        per_worker = options['writes_per_worker']
+        original_name = connection.settings_dict['NAME']
+        original_pragmas = settings.SQLITE_PRAGMAS
+        context = multiprocessing.get_context('fork')
+
+        try:
+            for name in profiles:
+                profile = settings.SQLITE_PROFILES[name]
+                with tempfile.TemporaryDirectory() as tmp:
+                    connections.close_all()
+                    connection.settings_dict['NAME'] = os.path.join(tmp, 'bench.sqlite3')
+                    settings.SQLITE_PRAGMAS = profile['PRAGMAS']
+                    call_command('migrate', verbosity=0)
+
+                    # Staff with no assignments yet, one batch of projects each
+                    generate(
+                        orgs=1, users_per_org=workers + 1,
+                        projects_per_org=per_worker, density=0, prefix='bench',
+                    )
+                    admin_id = User.objects.get(role='admin').id
+                    staff_ids = list(User.objects.filter(role='staff').values_list('id', flat=True))
+                    project_ids = list(Project.objects.values_list('id', flat=True))
+                    connections.close_all()
+
+                    results = context.Queue()
+                    processes = [
+                        context.Process(target=_worker, args=(
+                            [(staff_id, project_id) for project_id in project_ids],
+                            admin_id, profile['PRAGMAS'], profile['CONN_MAX_AGE'], results,
+                        ))
+                        for staff_id in staff_ids
+                    ]
+                    start = time.perf_counter()
+                    for process in processes:
+                        process.start()
+                    outcomes = [results.get() for _ in processes]
+                    for process in processes:
+                        process.join()
+                    elapsed = time.perf_counter() - start
+                    connections.close_all()
+
+                done = sum(d for d, _ in outcomes)
+                locked = sum(l for _, l in outcomes)
+                self.stdout.write(
+                    f'{name:>12}: {done / elapsed:8.1f} writes/s, '
+                    f'{locked} "database is locked" errors, {elapsed:.2f}s '
+                    f'({workers} workers x {per_worker} assign+unlock)'
+                )
+        finally:
+            connection.settings_dict['NAME'] = original_name
+            settings.SQLITE_PRAGMAS = original_pragmas
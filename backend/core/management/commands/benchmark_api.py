@@ -0,0 +1,238 @@
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from itertools import product
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.cache import bump_generation
+from core.management.commands.generate_load_data import generate, scratch_database
+from core.models import User, Project, Assignment
+
+ENDPOINTS = (
+    'login_view', 'staff_list', 'projects_list', 'assignments_list',
+    'my_assignments', 'assign_project', 'unlock_project', 'stats',
+)
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the core API endpoints against seeded data sets'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000',
+                            help='Comma separated approximate assignment counts')
+        parser.add_argument('--iterations', type=int, default=30)
+        parser.add_argument('--endpoints', default=','.join(ENDPOINTS))
+        parser.add_argument('--warm-cache', action='store_true',
+                            help='Let the API response cache serve repeated list requests')
+        parser.add_argument('--output', help='Write results as JSON to this file')
+        parser.add_argument('--compare', help='Baseline JSON file to check for regressions')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed relative slowdown or memory growth')
+
+    def handle(self, *args, **options):
+        endpoints = options['endpoints'].split(',')
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise CommandError(f'Unknown endpoints: {", ".join(sorted(unknown))}')
+        self.iterations = options['iterations']
+        self.warm_cache = options['warm_cache']
+
+        results = {}
+        with scratch_database():
+            for size in (int(s) for s in options['sizes'].split(',')):
+                call_command('flush', interactive=False, verbosity=0)
+                self.seed(size)
+                results[str(size)] = {
+                    name: self.measure(getattr(self, f'request_{name}'))
+                    for name in endpoints
+                }
+                self.report(size, results[str(size)])
+
+        report = {
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'iterations': self.iterations,
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Wrote {options["output"]}')
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+            self.compare(baseline['results'], results, options['threshold'])
+
+    def seed(self, size):
+        projects_per_org = 20
+        density = 0.5
+        orgs = max(1, size // 2000)
+        counts = generate(
+            orgs=orgs,
+            users_per_org=1 + -(-size // int(orgs * projects_per_org * density)),
+            projects_per_org=projects_per_org,
+            density=density,
+            prefix='bench',
+        )
+        self.stdout.write(
+            f'\nSeeded {counts["assignments"]} assignments, {counts["users"]} users, '
+            f'{counts["projects"]} projects'
+        )
+
+        self.admin = User.objects.filter(role='admin').order_by('id').first()
+        self.staff = User.objects.filter(
+            role='staff', assignments__isnull=False
+        ).order_by('id').first()
+        self.tokens = {}
+
+        # Unassigned (staff, project) pairs of the first organization
+        staff_ids = User.objects.filter(
+            role='staff', organization=self.admin.organization
+        ).values_list('id', flat=True)
+        project_ids = Project.objects.filter(
+            organization=self.admin.organization
+        ).values_list('id', flat=True)
+        assigned = set(Assignment.objects.filter(
+            project_id__in=project_ids
+        ).values_list('staff_id', 'project_id'))
+        self.free_pairs = [
+            pair for pair in product(staff_ids, project_ids) if pair not in assigned
+        ]
+        self.locked = list(Assignment.objects.filter(
+            is_unlocked=False
+        ).order_by('id').values_list('id', 'staff_id')[:self.iterations * 2])
+
+    def client_for(self, user_id):
+        if user_id not in self.tokens:
+            user = User.objects.get(id=user_id)
+            self.tokens[user_id] = str(RefreshToken.for_user(user).access_token)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.tokens[user_id]}')
+        return client
+
+    def request_login_view(self, i):
+        return APIClient().post(
+            '/api/login/',
+            {'username': self.admin.username, 'password': 'password'},
+            format='json'
+        )
+
+    def request_staff_list(self, i):
+        return self.client_for(self.admin.id).get('/api/staff/')
+
+    def request_projects_list(self, i):
+        return self.client_for(self.admin.id).get('/api/projects/')
+
+    def request_assignments_list(self, i):
+        return self.client_for(self.admin.id).get('/api/assignments/')
+
+    def request_my_assignments(self, i):
+        return self.client_for(self.staff.id).get('/api/my-assignments/')
+
+    def request_assign_project(self, i):
+        staff_id, project_id = self.free_pairs.pop()
+        return self.client_for(self.admin.id).post(
+            '/api/assign-project/',
+            {'staff_id': staff_id, 'project_id': project_id,
+             'project_password': 'project123'},
+            format='json'
+        )
+
+    def request_unlock_project(self, i):
+        assignment_id, staff_id = self.locked.pop()
+        return self.client_for(staff_id).post(
+            '/api/unlock-project/',
+            {'assignment_id': assignment_id, 'project_password': 'project123'},
+            format='json'
+        )
+
+    def request_stats(self, i):
+        return self.client_for(self.admin.id).get('/api/stats/')
+
+    def measure(self, send):
+        latencies = []
+        queries = []
+        peak = 0
+        # One untimed warm-up request, then timed ones, then one traced for memory
+        for i in range(self.iterations + 2):
+            if not self.warm_cache:
+                bump_generation()
+            # Measure the endpoints themselves, not the login/unlock throttles
+            caches['throttle'].clear()
+            traced = i == self.iterations + 1
+            if traced:
+                tracemalloc.start()
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                response = send(i)
+                elapsed = time.perf_counter() - start
+            if traced:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            if response.status_code >= 400:
+                raise CommandError(
+                    f'{send.__name__} returned {response.status_code}: {response.content[:200]}'
+                )
+            if 0 < i <= self.iterations:
+                latencies.append(elapsed * 1000)
+                queries.append(len(ctx))
+
+        return {
+            'p50_ms': round(_percentile(latencies, 50), 3),
+            'p90_ms': round(_percentile(latencies, 90), 3),
+            'p99_ms': round(_percentile(latencies, 99), 3),
+            'mean_ms': round(statistics.mean(latencies), 3),
+            'queries': max(queries),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    def report(self, size, results):
+        self.stdout.write(
+            f'{"endpoint":<18}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}'
+            f'{"queries":>9}{"peak KB":>10}'
+        )
+        for name, r in results.items():
+            self.stdout.write(
+                f'{name:<18}{r["p50_ms"]:>10.2f}{r["p90_ms"]:>10.2f}{r["p99_ms"]:>10.2f}'
+                f'{r["queries"]:>9}{r["peak_kb"]:>10.1f}'
+            )
+
+    def compare(self, baseline, results, threshold):
+        regressions = []
+        for size, endpoints in results.items():
+            for name, current in endpoints.items():
+                before = baseline.get(size, {}).get(name)
+                if before is None:
+                    continue
+                if current['p50_ms'] > before['p50_ms'] * (1 + threshold):
+                    regressions.append(
+                        f'{size}/{name}: p50 {before["p50_ms"]} -> {current["p50_ms"]} ms'
+                    )
+                if current['queries'] > before['queries']:
+                    regressions.append(
+                        f'{size}/{name}: queries {before["queries"]} -> {current["queries"]}'
+                    )
+                if current['peak_kb'] > before['peak_kb'] * (1 + threshold):
+                    regressions.append(
+                        f'{size}/{name}: peak {before["peak_kb"]} -> {current["peak_kb"]} KB'
+                    )
+
+        if regressions:
+            for line in regressions:
+                self.stdout.write(self.style.ERROR(f'REGRESSION {line}'))
+            raise CommandError(f'{len(regressions)} regressions against baseline')
+        self.stdout.write(self.style.SUCCESS('No regressions against baseline'))
@@ -0,0 +1,187 @@
+import random
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from core.cache import bump_generation
+from core.models import User, Organization, Project, Assignment, ProjectStats
+
+
+def _insert(model, objs, batch_size):
+    """bulk_create an iterable in fixed-size batches without materializing it"""
+    objs = iter(objs)
+    count = 0
+    while True:
+        batch = list(islice(objs, batch_size))
+        if not batch:
+            return count
+        model.objects.bulk_create(batch, batch_size=batch_size)
+        count += len(batch)
+
+
+def generate(orgs, users_per_org, projects_per_org, density, seed=0,
+             prefix='load', batch_size=5000, password='password',
+             project_password='project123'):
+    """Create a synthetic data set and return the number of rows per model
+
+    Each organization gets one admin plus ``users_per_org - 1`` staff and
+    ``projects_per_org`` projects. Every staff member is assigned to each of
+    their organization's projects with probability ``density``. The same
+    ``seed`` always produces the same data.
+    """
+    if Organization.objects.filter(name__startswith=f'{prefix}-').exists():
+        raise CommandError(f'Data with prefix "{prefix}" already exists')
+
+    rng = random.Random(seed)
+    # Hash once; every generated account shares the same password
+    user_hash = make_password(password)
+    project_hash = make_password(project_password)
+
+    with transaction.atomic():
+        _insert(Organization, (
+            Organization(name=f'{prefix}-org-{o:05d}', description='Generated organization')
+            for o in range(orgs)
+        ), batch_size)
+        org_ids = list(
+            Organization.objects.filter(name__startswith=f'{prefix}-')
+            .order_by('name').values_list('id', flat=True)
+        )
+
+        _insert(User, (
+            User(
+                username=f'{prefix}-{o:05d}-{u:05d}',
+                password=user_hash,
+                role='admin' if u == 0 else 'staff',
+                is_staff=u == 0,
+                organization_id=org_id,
+            )
+            for o, org_id in enumerate(org_ids)
+            for u in range(users_per_org)
+        ), batch_size)
+        # org_id -> [admin_id, [staff_id, ...]]
+        users = {org_id: [None, []] for org_id in org_ids}
+        for user_id, org_id, role in (
+            User.objects.filter(username__startswith=f'{prefix}-')
+            .order_by('username').values_list('id', 'organization_id', 'role')
+        ):
+            if role == 'admin':
+                users[org_id][0] = user_id
+            else:
+                users[org_id][1].append(user_id)
+
+        _insert(Project, (
+            Project(
+                name=f'{prefix}-project-{p:05d}',
+                description='Generated project',
+                password=project_hash,
+                organization_id=org_id,
+                created_by_id=users[org_id][0],
+            )
+            for org_id in org_ids
+            for p in range(projects_per_org)
+        ), batch_size)
+        projects = {}
+        for project_id, org_id in (
+            Project.objects.filter(organization_id__in=org_ids)
+            .order_by('id').values_list('id', 'organization_id')
+        ):
+            projects.setdefault(org_id, []).append(project_id)
+
+        def assignments():
+            for org_id in org_ids:
+                admin_id, staff_ids = users[org_id]
+                for staff_id in staff_ids:
+                    for project_id in projects.get(org_id, ()):
+                        if rng.random() < density:
+                            yield Assignment(
+                                staff_id=staff_id,
+                                project_id=project_id,
+                                assigned_by_id=admin_id,
+                            )
+
+        assignment_count = _insert(Assignment, assignments(), batch_size)
+
+        # bulk_create sends no post_save, so count the new rows explicitly
+        ProjectStats.objects.recount(
+            Project.objects.filter(organization_id__in=org_ids).values('pk')
+        )
+
+    # bulk_create sends no post_save, so retire cached lists explicitly
+    bump_generation()
+
+    return {
+        'organizations': len(org_ids),
+        'users': sum(1 + len(staff) for _, staff in users.values()),
+        'projects': sum(len(p) for p in projects.values()),
+        'assignments': assignment_count,
+    }
+
+
+def generate_assignments(rows, prefix='bench'):
+    """generate() about ``rows`` assignments, every staff member on every project"""
+    projects_per_org = 20
+    orgs = max(1, rows // 1000)
+    return generate(
+        orgs=orgs,
+        users_per_org=1 + -(-rows // (orgs * projects_per_org)),
+        projects_per_org=projects_per_org,
+        density=1.0,
+        prefix=prefix,
+    )
+
+
+@contextmanager
+def scratch_database():
+    """Run the block against a throwaway test database so the real one is never touched"""
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        # Connections opened by worker threads would keep the database open
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+class Command(BaseCommand):
+    help = 'Generate a large synthetic data set for performance testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orgs', type=int, default=10)
+        parser.add_argument('--users-per-org', type=int, default=100,
+                            help='One admin plus staff members per organization')
+        parser.add_argument('--projects-per-org', type=int, default=20)
+        parser.add_argument('--density', type=float, default=0.25,
+                            help='Probability that a staff member is assigned to each project')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--prefix', default='load',
+                            help='Name prefix, so several data sets can coexist')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if options['users_per_org'] < 1:
+            raise CommandError('--users-per-org must be at least 1')
+        if not 0 <= options['density'] <= 1:
+            raise CommandError('--density must be between 0 and 1')
+
+        start = time.perf_counter()
+        counts = generate(
+            orgs=options['orgs'],
+            users_per_org=options['users_per_org'],
+            projects_per_org=options['projects_per_org'],
+            density=options['density'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+        )
+        elapsed = time.perf_counter() - start
+
+        for model, count in counts.items():
+            self.stdout.write(f'{model}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated data in {elapsed:.1f}s '
+            f'(users: {options["prefix"]}-NNNNN-NNNNN/password, projects: project123)'
+        ))
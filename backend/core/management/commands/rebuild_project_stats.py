@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F, Q
+from core.cache import bump_generation
+from core.models import Project, ProjectStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the ProjectStats rollup from the assignments table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true',
+                            help='Only report rows that differ from a fresh count')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_drift()
+            return
+
+        start = time.perf_counter()
+        with transaction.atomic():
+            rows = ProjectStats.objects.recount()
+        bump_generation()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {rows} project stats rows in {time.perf_counter() - start:.2f}s'
+        ))
+
+    def check_drift(self):
+        missing = Project.objects.filter(stats__isnull=True).count()
+        drifted = ProjectStats.objects.with_actual_counts().filter(
+            ~Q(assignments_count=F('actual_assignments_count'))
+            | ~Q(unlocked_count=F('actual_unlocked_count'))
+        ).select_related('project')
+
+        problems = 0
+        for stats in drifted:
+            problems += 1
+            self.stdout.write(
+                f'{stats.project}: assignments {stats.assignments_count} '
+                f'(actual {stats.actual_assignments_count}), unlocked '
+                f'{stats.unlocked_count} (actual {stats.actual_unlocked_count})'
+            )
+        if missing:
+            self.stdout.write(f'{missing} projects have no stats row')
+        if problems or missing:
+            raise CommandError(
+                f'{problems + missing} projects out of date; run rebuild_project_stats'
+            )
+        self.stdout.write(self.style.SUCCESS('Project stats match the assignments table'))
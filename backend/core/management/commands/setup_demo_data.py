@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from core.models import Organization, Project
 
 User = get_user_model()
@@ -74,7 +75,7 @@ class Command(BaseCommand):
             organization=tech_corp,
             defaults={
                 'description': 'Overhaul company website with modern design',
-                'password': 'project123',
+                'password': make_password('project123'),
                 'created_by': admin1
             }
         )
@@ -87,7 +88,7 @@ class Command(BaseCommand):
             organization=tech_corp,
             defaults={
                 'description': 'Develop iOS & Android apps',
-                'password': 'mobile456',
+                'password': make_password('mobile456'),
                 'created_by': admin1
             }
         )
@@ -0,0 +1,128 @@
+import json
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .instrumentation import RequestMetrics, end_request, start_request
+
+logger = logging.getLogger('core.instrumentation')
+
+
+class RequestInstrumentationMiddleware:
+    """Report query count, SQL time, serializer time and view time per request
+
+    A fraction INSTRUMENTATION_SAMPLE_RATE of requests is measured. Results
+    go out as a Server-Timing header and a JSON log line; requests slower
+    than INSTRUMENTATION_SLOW_MS also log every SQL statement they ran.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.INSTRUMENTATION_SAMPLE_RATE:
+            return self.get_response(request)
+
+        metrics = RequestMetrics(keep_sql=settings.INSTRUMENTATION_SLOW_MS is not None)
+        token = start_request(metrics)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics.record_query):
+                response = self.get_response(request)
+        finally:
+            end_request(token)
+        view_ms = (time.perf_counter() - start) * 1000
+
+        sql_ms = metrics.sql_seconds * 1000
+        serialize_ms = metrics.timings.get('serialize', 0.0) * 1000
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={sql_ms:.1f};desc="{metrics.query_count} queries"',
+            f'serialize;dur={serialize_ms:.1f}',
+            f'view;dur={view_ms:.1f}',
+        ])
+
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': metrics.query_count,
+            'sql_ms': round(sql_ms, 1),
+            'serialize_ms': round(serialize_ms, 1),
+            'view_ms': round(view_ms, 1),
+        }
+        slow_ms = settings.INSTRUMENTATION_SLOW_MS
+        if slow_ms is not None and view_ms >= slow_ms:
+            record['sql'] = [{'ms': ms, 'sql': sql} for ms, sql in metrics.queries]
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
+        return response
+
+
+def _accepted_encodings(header):
+    """{'gzip': 1.0, 'br': 0.5, ...} from an Accept-Encoding header"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress responses with brotli or gzip, whichever the client prefers
+
+    brotli is only offered when the brotli package is installed; ties go to
+    brotli. gzip, streaming responses included, is left to Django's
+    GZipMiddleware and keeps its BREACH mitigation. Bodies smaller than
+    COMPRESSION_MIN_SIZE bytes are sent as is. Strong ETags become weak
+    ones. Being a MiddlewareMixin, it runs without a thread hop under ASGI.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or response.status_code == 304:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        gzip_q = accepted.get('gzip', accepted.get('*', 0.0))
+        br_q = accepted.get('br', accepted.get('*', 0.0)) if brotli is not None else 0.0
+
+        if br_q > 0 and br_q >= gzip_q and not response.streaming:
+            return self.compress_brotli(response)
+        if gzip_q <= 0:
+            patch_vary_headers(response, ('Accept-Encoding',))
+            return response
+        return super().process_response(request, response)
+
+    def compress_brotli(self, response):
+        patch_vary_headers(response, ('Accept-Encoding',))
+        content = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        if len(content) >= len(response.content):
+            return response
+        response.content = content
+        response.headers['Content-Length'] = str(len(content))
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
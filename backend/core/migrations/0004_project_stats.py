@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def populate_project_stats(apps, schema_editor):
+    Project = apps.get_model('core', 'Project')
+    Assignment = apps.get_model('core', 'Assignment')
+    ProjectStats = apps.get_model('core', 'ProjectStats')
+
+    def count(**filters):
+        return Coalesce(Subquery(
+            Assignment.objects.filter(project=OuterRef('project'), **filters)
+            .order_by().values('project').annotate(n=Count('pk')).values('n')
+        ), Value(0))
+
+    ProjectStats.objects.bulk_create(
+        [ProjectStats(project_id=pk) for pk in Project.objects.values_list('pk', flat=True)],
+        batch_size=1000
+    )
+    ProjectStats.objects.update(
+        assignments_count=count(),
+        unlocked_count=count(is_unlocked=True),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_role_active_unlocked_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='core.project')),
+                ('assignments_count', models.IntegerField(default=0)),
+                ('unlocked_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'project stats',
+            },
+        ),
+        migrations.RunPython(populate_project_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_project_stats'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='core_assign_unlocked_idx',
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('is_unlocked', True)), fields=['-assigned_at', '-id'], name='core_assign_unlocked_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('is_unlocked', False)), fields=['-assigned_at', '-id'], name='core_assign_locked_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:20
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Coalesce
+import django.utils.timezone
+
+
+def backfill_updated_at(apps, schema_editor):
+    Assignment = apps.get_model('core', 'Assignment')
+    Assignment.objects.update(updated_at=Coalesce(F('unlocked_at'), F('assigned_at')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_partial_unlocked_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,11 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Max, OuterRef, Prefetch, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from .cache import bump_generation
+
 
 class User(AbstractUser):
     """Custom User Model with roles"""
@@ -11,23 +15,57 @@ class User(AbstractUser):
         ('staff', 'Staff'),
     ]
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='staff')
+    updated_at = models.DateTimeField(auto_now=True)
     organization = models.ForeignKey(
         'Organization', 
         on_delete=models.SET_NULL, 
         null=True, 
         blank=True
     )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # staff_list: role + is_active, ordered by username
+            models.Index(
+                fields=['role', 'username'],
+                condition=Q(is_active=True),
+                name='core_user_active_role_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
 
 
+def _count(queryset, field, outer='pk'):
+    """Subquery counting the rows of ``queryset`` whose ``field`` is the outer row's ``outer``"""
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef(outer)})
+        .order_by().values(field).annotate(n=Count('pk')).values('n')
+    ), Value(0))
+
+
+class OrganizationQuerySet(models.QuerySet):
+    """Organization QuerySet"""
+
+    def with_counts(self):
+        """Annotate projects_count and users_count"""
+        # One indexed subquery per count, instead of COUNT(DISTINCT) over
+        # the projects x users join
+        return self.annotate(
+            projects_count=_count(Project.objects.all(), 'organization'),
+            users_count=_count(User.objects.all(), 'organization'),
+        )
+
+
 class Organization(models.Model):
     """Organization Model"""
     name = models.CharField(max_length=200, unique=True)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = OrganizationQuerySet.as_manager()
     
     def __str__(self):
         return self.name
@@ -36,6 +74,26 @@ class Organization(models.Model):
         ordering = ['name']
 
 
+class ProjectQuerySet(models.QuerySet):
+    """Project QuerySet"""
+
+    def with_counts(self):
+        """Annotate assignments_count"""
+        # A correlated subquery keeps GROUP BY off the paginated query, so
+        # LIMIT still stops the index scan after one page
+        return self.annotate(
+            assignments_count=_count(Assignment.objects.all(), 'project')
+        )
+
+    def with_details(self):
+        """Load everything ProjectDetailSerializer reads, with precomputed counts"""
+        return self.select_related(
+            'created_by', 'created_by__organization'
+        ).prefetch_related(
+            Prefetch('organization', queryset=Organization.objects.with_counts())
+        ).with_counts()
+
+
 class Project(models.Model):
     """Project Model with password protection"""
     name = models.CharField(max_length=200)
@@ -57,6 +115,8 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
+
+    objects = ProjectQuerySet.as_manager()
     
     def __str__(self):
         return f"{self.name} - {self.organization.name}"
@@ -64,6 +124,67 @@ class Project(models.Model):
     class Meta:
         ordering = ['-created_at']
         unique_together = ['name', 'organization']
+        indexes = [
+            # projects_list: active projects, newest first
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=Q(is_active=True),
+                name='core_project_active_idx',
+            ),
+        ]
+
+
+# Edit times of the rows the assignment serializers render
+MARKER_STAMPS = (
+    'assigned_at', 'unlocked_at', 'updated_at',
+    'project__updated_at', 'project__organization__updated_at',
+    'project__created_by__updated_at', 'project__created_by__organization__updated_at',
+    'staff__updated_at', 'staff__organization__updated_at',
+    'assigned_by__updated_at', 'assigned_by__organization__updated_at',
+)
+
+
+class AssignmentQuerySet(models.QuerySet):
+    """Assignment QuerySet"""
+
+    def with_details(self):
+        """Load everything AssignmentDetailSerializer reads in a fixed number of queries"""
+        return self.select_related(
+            'staff', 'staff__organization',
+            'assigned_by', 'assigned_by__organization',
+        ).prefetch_related(
+            Prefetch('project', queryset=Project.objects.with_details())
+        )
+
+    def change_marker(self):
+        """Return (token, last_modified) describing these rows in one aggregate query
+
+        The token changes when anything the assignment serializers render
+        changes: an assignment is added, removed or edited (unlocking
+        included), a related project, organization or user is edited, or
+        the nested project and organization counts move.
+        """
+        marker = self.aggregate(
+            count=Count('id'),
+            unlocked=Count('id', filter=Q(is_unlocked=True)),
+            # The nested counts, summed over the rows
+            assignments_count=Sum(_count(Assignment.objects.all(), 'project', outer='project')),
+            projects_count=Sum(
+                _count(Project.objects.all(), 'organization', outer='project__organization')
+            ),
+            users_count=Sum(
+                _count(User.objects.all(), 'organization', outer='project__organization')
+            ),
+            **{path.replace('__', '_'): Max(path) for path in MARKER_STAMPS},
+        )
+        stamps = [
+            value for key, value in marker.items() if key.endswith('_at') and value
+        ]
+        token = ':'.join(
+            value.isoformat() if hasattr(value, 'isoformat') else str(value)
+            for value in marker.values()
+        )
+        return token, max(stamps, default=None)
 
 
 class Assignment(models.Model):
@@ -86,23 +207,139 @@ class Assignment(models.Model):
         limit_choices_to={'role': 'admin'}
     )
     assigned_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     is_unlocked = models.BooleanField(default=False)
     unlocked_at = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(
         blank=True, 
         help_text="Additional notes for this assignment"
     )
+
+    objects = AssignmentQuerySet.as_manager()
     
     class Meta:
         unique_together = ['staff', 'project']
         ordering = ['-assigned_at']
+        indexes = [
+            # my_assignments: one staff member's rows, newest first
+            models.Index(
+                fields=['staff', '-assigned_at', '-id'],
+                name='core_assign_staff_recent_idx',
+            ),
+            # assignments_list and the export, newest first
+            models.Index(
+                fields=['-assigned_at', '-id'],
+                name='core_assign_recent_idx',
+            ),
+            # export filtered by unlocked state. Partial indexes, because
+            # SQLite filters booleans on the bare column, which an
+            # (is_unlocked, ...) index prefix cannot serve
+            models.Index(
+                fields=['-assigned_at', '-id'],
+                condition=Q(is_unlocked=True),
+                name='core_assign_unlocked_idx',
+            ),
+            models.Index(
+                fields=['-assigned_at', '-id'],
+                condition=Q(is_unlocked=False),
+                name='core_assign_locked_idx',
+            ),
+        ]
     
     def unlock(self):
-        """Unlock the assignment"""
-        self.is_unlocked = True
-        self.unlocked_at = timezone.now()
-        self.save()
+        """Unlock the assignment, counting it in ProjectStats exactly once"""
+        now = timezone.now()
+        # The conditional update lets only one of several concurrent calls win
+        with transaction.atomic():
+            unlocked = Assignment.objects.filter(
+                pk=self.pk, is_unlocked=False
+            ).update(is_unlocked=True, unlocked_at=now, updated_at=now)
+            if unlocked:
+                ProjectStats.objects.increment(self.project_id, unlocked=1)
+                # QuerySet.update sends no post_save, so retire cached lists explicitly
+                transaction.on_commit(bump_generation)
+        if unlocked:
+            self.is_unlocked = True
+            self.unlocked_at = now
+        else:
+            self.refresh_from_db(fields=['is_unlocked', 'unlocked_at'])
     
     def __str__(self):
         status = "Unlocked" if self.is_unlocked else "Locked"
-        return f"{self.staff.username} - {self.project.name} ({status})"
\ No newline at end of file
+        return f"{self.staff.username} - {self.project.name} ({status})"
+
+def _assignment_count(**filters):
+    """Subquery counting the assignments of the outer row's project"""
+    return _count(Assignment.objects.filter(**filters), 'project', outer='project')
+
+
+class ProjectStatsQuerySet(models.QuerySet):
+    """ProjectStats QuerySet"""
+
+    def increment(self, project_id, assignments=0, unlocked=0):
+        """Atomically add to one project's counters"""
+        changes = {}
+        if assignments:
+            changes['assignments_count'] = F('assignments_count') + assignments
+        if unlocked:
+            changes['unlocked_count'] = F('unlocked_count') + unlocked
+        updated = self.filter(project_id=project_id).update(**changes) if changes else 1
+        if not updated and assignments >= 0:
+            # No row yet (e.g. a bulk-created project): count from scratch.
+            # Removals skip this, their project may be getting deleted.
+            self.recount([project_id])
+
+    def with_actual_counts(self):
+        """Annotate the counts recomputed from the assignments table"""
+        return self.annotate(
+            actual_assignments_count=_assignment_count(),
+            actual_unlocked_count=_assignment_count(is_unlocked=True),
+        )
+
+    def recount(self, project_ids=None):
+        """Recompute counters from the assignments table, creating missing rows
+
+        Each row is set by a single UPDATE with correlated subqueries, so
+        concurrent increments are never lost. Returns the number of rows.
+        """
+        projects = Project.objects.filter(stats__isnull=True)
+        rows = self.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=project_ids)
+            rows = rows.filter(project_id__in=project_ids)
+        self.bulk_create(
+            [ProjectStats(project_id=pk) for pk in projects.values_list('pk', flat=True)],
+            ignore_conflicts=True
+        )
+        return rows.update(
+            assignments_count=_assignment_count(),
+            unlocked_count=_assignment_count(is_unlocked=True),
+        )
+
+
+class ProjectStats(models.Model):
+    """Per-project assignment counters for the stats endpoint
+
+    Kept current with F() increments by core.signals, Assignment.unlock and
+    the bulk views; rebuild_project_stats recomputes them from scratch.
+    """
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    assignments_count = models.IntegerField(default=0)
+    unlocked_count = models.IntegerField(default=0)
+
+    objects = ProjectStatsQuerySet.as_manager()
+
+    class Meta:
+        verbose_name_plural = 'project stats'
+
+    @property
+    def locked_count(self):
+        return self.assignments_count - self.unlocked_count
+
+    def __str__(self):
+        return f"{self.project_id}: {self.unlocked_count}/{self.assignments_count} unlocked"
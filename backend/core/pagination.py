@@ -0,0 +1,40 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+from .fieldsets import DynamicFieldsMixin, narrow_queryset
+from .instrumentation import timed
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor (keyset) pagination shared by the list endpoints"""
+    page_size = settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.MAX_PAGE_SIZE
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+
+def paginated_response(request, queryset, serializer_class, ordering):
+    """Serialize one page of ``queryset`` in DRF's paginated shape
+
+    ``ordering`` should end with a unique column (``id``) so that rows
+    sharing a timestamp still come back in a stable order. Querysets for
+    DynamicFieldsMixin serializers are narrowed to the requested fields,
+    so pass them without select_related/prefetch_related.
+    """
+    paginator = KeysetPagination(ordering)
+    context = {'request': request}
+    if issubclass(serializer_class, DynamicFieldsMixin):
+        # Load only what this request's ?fields= / ?expand= will emit
+        queryset = narrow_queryset(queryset, serializer_class(context=context), ordering)
+    page = paginator.paginate_queryset(queryset, request)
+    with timed('serialize'):
+        serializer = serializer_class(page, many=True, context=context)
+        data = serializer.data
+        # Normalized serializers side-load related objects next to the rows
+        included = getattr(serializer, 'included', None)
+    response = paginator.get_paginated_response(data)
+    if included:
+        response.data.update(included)
+    return response
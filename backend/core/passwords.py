@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.utils.crypto import salted_hmac
+
+from .models import Project
+
+# Successful project password checks: HMAC(hash, candidate) -> (expires_at, HMAC(hash))
+# Plaintext passwords are never stored, only keyed digests.
+_verified = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _digest(*parts):
+    return salted_hmac(
+        'core.passwords', '\0'.join(parts), algorithm='sha256'
+    ).hexdigest()
+
+
+def check_project_password(project, raw_password):
+    """check_password for Project.password, remembering recent successes"""
+    encoded = project.password
+    key = _digest(encoded, raw_password)
+    now = time.monotonic()
+
+    with _lock:
+        entry = _verified.get(key)
+        if entry is not None and entry[0] > now:
+            _verified.move_to_end(key)
+            _stats['hits'] += 1
+            return True
+        _verified.pop(key, None)
+        _stats['misses'] += 1
+
+    def upgrade(raw_password):
+        # Same policy as User passwords: rehash with the preferred hasher.
+        # The conditional update leaves a concurrently changed password alone.
+        project.password = make_password(raw_password)
+        Project.objects.filter(
+            pk=project.pk, password=encoded
+        ).update(password=project.password)
+        invalidate_project_password(encoded)
+
+    if not check_password(raw_password, encoded, setter=upgrade):
+        return False
+
+    if project.password != encoded:
+        encoded = project.password
+        key = _digest(encoded, raw_password)
+    with _lock:
+        _verified[key] = (now + settings.PROJECT_PASSWORD_CACHE_TTL, _digest(encoded))
+        while len(_verified) > settings.PROJECT_PASSWORD_CACHE_SIZE:
+            _verified.popitem(last=False)
+    return True
+
+
+def invalidate_project_password(encoded):
+    """Forget every cached verification of the given password hash"""
+    if not encoded:
+        return
+    tag = _digest(encoded)
+    with _lock:
+        stale = [key for key, (_, entry_tag) in _verified.items() if entry_tag == tag]
+        for key in stale:
+            del _verified[key]
+
+
+def password_cache_stats():
+    """Hit/miss counters and current size of the verification cache"""
+    with _lock:
+        return dict(_stats, size=len(_verified))
@@ -0,0 +1,32 @@
+"""orjson-backed JSON renderer with a stdlib fallback
+
+orjson is optional. Without it, or when the client asks for indented
+output, OrjsonRenderer behaves exactly like DRF's JSONRenderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson
+
+    Datetimes come out as DRF writes them (UTC as ``Z``). Anything orjson
+    cannot encode natively, e.g. Decimal or lazy translation strings, goes
+    through DRF's JSONEncoder.default.
+    """
+    options = 0 if orjson is None else (
+        orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    )
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=self._encoder.default, option=self.options)
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth.hashers import make_password
-from .models import User, Organization, Project, Assignment
+from .fieldsets import DynamicFieldsMixin
+from .models import User, Organization, Project, Assignment, ProjectStats
+from .passwords import invalidate_project_password
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """User Serializer"""
     organization_name = serializers.CharField(
         source='organization.name', 
@@ -26,8 +28,9 @@ class UserSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
+class OrganizationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Organization Serializer"""
+    annotated_fields = ('projects_count', 'users_count')
     projects_count = serializers.SerializerMethodField()
     users_count = serializers.SerializerMethodField()
     
@@ -36,14 +39,21 @@ class OrganizationSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'created_at', 'projects_count', 'users_count']
     
     def get_projects_count(self, obj):
-        return obj.projects.count()
+        count = getattr(obj, 'projects_count', None)
+        if count is None:
+            count = obj.projects.count()
+        return count
     
     def get_users_count(self, obj):
-        return obj.user_set.count()
+        count = getattr(obj, 'users_count', None)
+        if count is None:
+            count = obj.user_set.count()
+        return count
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Project Serializer"""
+    annotated_fields = ('assignments_count',)
     organization_name = serializers.CharField(source='organization.name', read_only=True)
     created_by_username = serializers.CharField(source='created_by.username', read_only=True)
     assignments_count = serializers.SerializerMethodField()
@@ -58,7 +68,10 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
     
     def get_assignments_count(self, obj):
-        return obj.assignments.count()
+        count = getattr(obj, 'assignments_count', None)
+        if count is None:
+            count = obj.assignments.count()
+        return count
     
     def create(self, validated_data):
         """Hash project password before saving"""
@@ -66,6 +79,13 @@ class ProjectSerializer(serializers.ModelSerializer):
             validated_data['password'] = make_password(validated_data['password'])
         return super().create(validated_data)
 
+    def update(self, instance, validated_data):
+        """Hash a new project password and drop cached verifications of the old one"""
+        if 'password' in validated_data:
+            invalidate_project_password(instance.password)
+            validated_data['password'] = make_password(validated_data['password'])
+        return super().update(instance, validated_data)
+
 
 class ProjectDetailSerializer(ProjectSerializer):
     """Detailed Project Serializer"""
@@ -73,7 +93,7 @@ class ProjectDetailSerializer(ProjectSerializer):
     created_by = UserSerializer(read_only=True)
 
 
-class AssignmentSerializer(serializers.ModelSerializer):
+class AssignmentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Assignment Serializer"""
     staff_username = serializers.CharField(source='staff.username', read_only=True)
     staff_email = serializers.CharField(source='staff.email', read_only=True)
@@ -91,6 +111,49 @@ class AssignmentSerializer(serializers.ModelSerializer):
         read_only_fields = ['assigned_at', 'unlocked_at', 'is_unlocked']
 
 
+class CompactAssignmentSerializer:
+    """Flat assignment rows built from ``.values()`` without DRF fields
+
+    Emits the same keys as AssignmentSerializer. Pass it dicts produced by
+    ``queryset.values(*CompactAssignmentSerializer.columns)``.
+    """
+    column_map = {
+        'id': 'id',
+        'staff': 'staff_id',
+        'staff_username': 'staff__username',
+        'staff_email': 'staff__email',
+        'project': 'project_id',
+        'project_name': 'project__name',
+        'organization_name': 'project__organization__name',
+        'assigned_by': 'assigned_by_id',
+        'assigned_by_username': 'assigned_by__username',
+        'assigned_at': 'assigned_at',
+        'is_unlocked': 'is_unlocked',
+        'unlocked_at': 'unlocked_at',
+        'notes': 'notes',
+    }
+    columns = tuple(column_map.values())
+    datetime_field = serializers.DateTimeField()
+
+    def __init__(self, instance, many=False, context=None):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+
+    def to_representation(self, row):
+        data = {name: row[column] for name, column in self.column_map.items()}
+        for name in ('assigned_at', 'unlocked_at'):
+            if data[name] is not None:
+                data[name] = self.datetime_field.to_representation(data[name])
+        return data
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(row) for row in self.instance]
+        return self.to_representation(self.instance)
+
+
 class AssignmentDetailSerializer(AssignmentSerializer):
     """Detailed Assignment Serializer"""
     staff = UserSerializer(read_only=True)
@@ -98,6 +161,73 @@ class AssignmentDetailSerializer(AssignmentSerializer):
     assigned_by = UserSerializer(read_only=True)
 
 
+class NormalizedAssignmentListSerializer(serializers.ListSerializer):
+    """Assignment rows plus each related object serialized once
+
+    ``included`` holds the side-loaded ``projects``, ``organizations`` and
+    ``users`` maps, keyed by id, for the rows in ``instance``. They are
+    loaded with one query per model.
+    """
+
+    @property
+    def included(self):
+        if not hasattr(self, '_included'):
+            rows = list(self.instance)
+            projects = Project.objects.select_related(
+                'organization', 'created_by'
+            ).with_counts().in_bulk({row.project_id for row in rows})
+            users = User.objects.select_related('organization').in_bulk(
+                {row.staff_id for row in rows}
+                | {row.assigned_by_id for row in rows}
+                | {project.created_by_id for project in projects.values()}
+            )
+            organizations = Organization.objects.with_counts().in_bulk(
+                {project.organization_id for project in projects.values()}
+                | {user.organization_id for user in users.values() if user.organization_id}
+            )
+            self._included = {
+                'projects': {
+                    pk: ProjectSerializer(obj).data for pk, obj in projects.items()
+                },
+                'organizations': {
+                    pk: OrganizationSerializer(obj).data for pk, obj in organizations.items()
+                },
+                'users': {
+                    pk: UserSerializer(obj).data for pk, obj in users.items()
+                },
+            }
+        return self._included
+
+
+class NormalizedAssignmentSerializer(serializers.ModelSerializer):
+    """Assignment row referencing staff, project and assigned_by by id
+
+    Use with ``many=True``; the related objects are in ``.included``.
+    """
+
+    class Meta:
+        model = Assignment
+        fields = [
+            'id', 'staff', 'project', 'assigned_by', 'assigned_at',
+            'is_unlocked', 'unlocked_at', 'notes'
+        ]
+        list_serializer_class = NormalizedAssignmentListSerializer
+
+
+class ProjectStatsSerializer(serializers.ModelSerializer):
+    """Project Stats Serializer"""
+    project_name = serializers.CharField(source='project.name', read_only=True)
+    organization = serializers.IntegerField(source='project.organization_id', read_only=True)
+    locked_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = ProjectStats
+        fields = [
+            'project', 'project_name', 'organization',
+            'assignments_count', 'unlocked_count', 'locked_count'
+        ]
+
+
 class LoginSerializer(serializers.Serializer):
     """Login Serializer"""
     username = serializers.CharField()
@@ -112,7 +242,29 @@ class AssignProjectSerializer(serializers.Serializer):
     notes = serializers.CharField(required=False, allow_blank=True)
 
 
+class BulkAssignProjectSerializer(serializers.Serializer):
+    """Bulk Assign Project Serializer"""
+    project_id = serializers.IntegerField()
+    staff_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=1000
+    )
+    project_password = serializers.CharField(write_only=True)
+    notes = serializers.CharField(required=False, allow_blank=True)
+
+
 class UnlockProjectSerializer(serializers.Serializer):
     """Unlock Project Serializer"""
     assignment_id = serializers.IntegerField()
-    project_password = serializers.CharField(write_only=True)
\ No newline at end of file
+    project_password = serializers.CharField(write_only=True)
+
+
+class BulkUnlockProjectSerializer(serializers.Serializer):
+    """Bulk Unlock Project Serializer"""
+    items = UnlockProjectSerializer(many=True, allow_empty=False)
+
+    def validate_items(self, items):
+        if len(items) > 500:
+            raise serializers.ValidationError('At most 500 items per request.')
+        return items
\ No newline at end of file
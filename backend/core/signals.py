@@ -0,0 +1,135 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .authentication import bump_user_version
+from .cache import bump_generation
+from .models import User, Organization, Project, Assignment, ProjectStats
+
+
+def _cascaded(sender, origin):
+    """Whether a post_delete comes from deleting rows of another model"""
+    if origin is None:
+        return False
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is not sender
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop cached authentication data whenever a user change commits"""
+    # Bumping before the commit would let a concurrent request re-cache the
+    # old row under the new stamp
+    user_id = instance.pk
+    transaction.on_commit(lambda: bump_user_version(user_id))
+
+
+@receiver(post_save, sender=Project)
+def create_project_stats(sender, instance, created, raw=False, **kwargs):
+    """Give every new project its (empty) ProjectStats row"""
+    if created and not raw:
+        ProjectStats.objects.get_or_create(project=instance)
+
+
+@receiver(pre_save, sender=Assignment)
+def remember_assignment_state(sender, instance, update_fields=None, **kwargs):
+    """Note the stored project and unlock state for count_saved_assignment"""
+    instance._stats_before = None
+    if instance._state.adding:
+        return
+    if update_fields is not None and not {'project', 'is_unlocked'} & set(update_fields):
+        return
+    instance._stats_before = Assignment.objects.filter(
+        pk=instance.pk
+    ).values_list('project_id', 'is_unlocked').first()
+
+
+@receiver(post_save, sender=Assignment)
+def count_saved_assignment(sender, instance, created, raw=False, **kwargs):
+    """Apply a created or edited assignment to ProjectStats"""
+    if raw:
+        return
+    if created:
+        ProjectStats.objects.increment(
+            instance.project_id, assignments=1, unlocked=int(instance.is_unlocked)
+        )
+        return
+
+    before = getattr(instance, '_stats_before', None)
+    if before is None:
+        return
+    project_id, was_unlocked = before
+    if project_id != instance.project_id:
+        ProjectStats.objects.increment(project_id, assignments=-1, unlocked=-int(was_unlocked))
+        ProjectStats.objects.increment(
+            instance.project_id, assignments=1, unlocked=int(instance.is_unlocked)
+        )
+    elif was_unlocked != instance.is_unlocked:
+        ProjectStats.objects.increment(project_id, unlocked=1 if instance.is_unlocked else -1)
+
+
+@receiver(post_delete, sender=Assignment)
+def count_deleted_assignment(sender, instance, origin=None, **kwargs):
+    """Remove a deleted assignment from ProjectStats
+
+    Assignments deleted along with their project lose their stats row too;
+    those deleted along with a user are recounted by recount_user_projects.
+    """
+    if _cascaded(sender, origin):
+        return
+    ProjectStats.objects.increment(
+        instance.project_id, assignments=-1, unlocked=-int(instance.is_unlocked)
+    )
+
+
+@receiver(pre_delete, sender=User)
+def remember_user_projects(sender, instance, **kwargs):
+    """Note the projects a user's assignments count towards, before they go"""
+    instance._stats_projects = set(
+        Assignment.objects.filter(Q(staff=instance) | Q(assigned_by=instance))
+        .values_list('project_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=User)
+def recount_user_projects(sender, instance, **kwargs):
+    """Recount each project a deleted user had assignments in, once"""
+    project_ids = getattr(instance, '_stats_projects', None)
+    if project_ids:
+        ProjectStats.objects.recount(project_ids)
+
+
+# Connected after the ProjectStats receivers above, so that the bump follows
+# their updates even in autocommit mode, where on_commit runs at once
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+def invalidate_api_cache(sender, origin=None, **kwargs):
+    """Retire cached list responses once a change to a core model commits
+
+    Rows deleted in a cascade leave the bump to the row that started it.
+    """
+    if _cascaded(sender, origin):
+        return
+    # A bump inside the transaction would let a concurrent GET cache the
+    # uncommitted-old rows under the new generation
+    transaction.on_commit(bump_generation)
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Apply the SQLITE_PROFILE pragmas to every new SQLite connection"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
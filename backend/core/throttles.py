@@ -0,0 +1,120 @@
+import hashlib
+import threading
+from collections import Counter
+from collections.abc import Mapping
+
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+_rejections = Counter()
+_lock = threading.Lock()
+
+
+def throttle_rejections():
+    """Number of requests each throttle scope has rejected in this process"""
+    with _lock:
+        return dict(_rejections)
+
+
+class PasswordAttemptThrottle(SimpleRateThrottle):
+    """Sliding-window throttle for endpoints that run a password hash
+
+    DRF checks throttles before the view body runs, so rejected attempts
+    never reach the hasher. History lives in the 'throttle' cache; once one
+    throttle rejects a request, the later ones neither count nor record it.
+    """
+    cache = caches['throttle']
+
+    def allow_request(self, request, view):
+        if getattr(request, '_password_throttled', False):
+            # An earlier throttle already rejected this request. Recording it
+            # here too would let a flood of junk usernames or targets fill
+            # the cache and crowd out the histories that matter.
+            return True
+        allowed = super().allow_request(request, view)
+        if not allowed:
+            request._password_throttled = True
+        return allowed
+
+    def get_rate(self):
+        # Read at request time so settings overrides apply; no rate = no limit
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_ident_for(self, request):
+        return None
+
+    def get_field(self, request, name):
+        # Throttles run before the serializer, so the body may be any JSON
+        if not isinstance(request.data, Mapping):
+            return None
+        return request.data.get(name)
+
+    def get_cache_key(self, request, view):
+        ident = self.get_ident_for(request)
+        if ident is None:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def throttle_failure(self):
+        with _lock:
+            _rejections[self.scope] += 1
+        return False
+
+
+class LoginIPThrottle(PasswordAttemptThrottle):
+    scope = 'login_ip'
+
+    def get_ident_for(self, request):
+        return self.get_ident(request)
+
+
+class LoginUsernameThrottle(PasswordAttemptThrottle):
+    scope = 'login_username'
+
+    def get_ident_for(self, request):
+        username = self.get_field(request, 'username')
+        if not isinstance(username, str) or not username:
+            return None
+        return hashlib.sha256(username.lower().encode()).hexdigest()
+
+
+class ProjectPasswordUserThrottle(PasswordAttemptThrottle):
+    scope = 'project_password_user'
+
+    def get_ident_for(self, request):
+        return request.user.pk
+
+
+class ProjectPasswordIPThrottle(PasswordAttemptThrottle):
+    scope = 'project_password_ip'
+
+    def get_ident_for(self, request):
+        return self.get_ident(request)
+
+
+class ProjectPasswordTargetThrottle(PasswordAttemptThrottle):
+    """Limits guesses against one assignment (unlock) or assignment target (assign)
+
+    Single assigns are keyed by (staff, project), so onboarding many staff
+    to one project is not throttled; bulk assigns are keyed by project.
+    """
+    scope = 'project_password_target'
+
+    def get_ident_for(self, request):
+        assignment_id = self.get_field(request, 'assignment_id')
+        if assignment_id is not None:
+            return f'assignment_id:{assignment_id}'
+        project_id = self.get_field(request, 'project_id')
+        if project_id is None:
+            return None
+        staff_id = self.get_field(request, 'staff_id')
+        if staff_id is not None:
+            return f'staff_id:{staff_id}:project_id:{project_id}'
+        return f'project_id:{project_id}'
+
+
+LOGIN_THROTTLES = [LoginIPThrottle, LoginUsernameThrottle]
+PROJECT_PASSWORD_THROTTLES = [
+    ProjectPasswordUserThrottle, ProjectPasswordIPThrottle, ProjectPasswordTargetThrottle,
+]
@@ -1,13 +1,22 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Read-only list endpoints served by async views under ASGI
+read_views = async_views if settings.ASYNC_READ_VIEWS else views
 
 urlpatterns = [
     path('', views.api_root, name='api-root'),
     path('login/', views.login_view, name='login'),
-    path('staff/', views.staff_list, name='staff-list'),
-    path('projects/', views.projects_list, name='projects-list'),
+    path('staff/', read_views.staff_list, name='staff-list'),
+    path('projects/', read_views.projects_list, name='projects-list'),
     path('assignments/', views.assignments_list, name='assignments-list'),
+    path('assignments/export/', views.assignments_export, name='assignments-export'),
+    path('stats/', views.stats, name='stats'),
+    path('metrics/', views.metrics, name='metrics'),
     path('assign-project/', views.assign_project, name='assign-project'),
-    path('my-assignments/', views.my_assignments, name='my-assignments'),
+    path('assign-project/bulk/', views.assign_project_bulk, name='assign-project-bulk'),
+    path('my-assignments/', read_views.my_assignments, name='my-assignments'),
     path('unlock-project/', views.unlock_project, name='unlock-project'),
+    path('unlock-project/bulk/', views.unlock_project_bulk, name='unlock-project-bulk'),
 ]
\ No newline at end of file
@@ -1,14 +1,28 @@
+import os
+
+from django.conf import settings
 from django.contrib.auth import authenticate
-from django.contrib.auth.hashers import check_password
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import status, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework_simplejwt.tokens import RefreshToken
-from .models import User, Project, Assignment
+from .models import User, Organization, Project, Assignment, ProjectStats
+from .cache import bump_generation, cached_response, conditional_response
+from .pagination import paginated_response
+from .passwords import check_project_password, password_cache_stats
+from .throttles import LOGIN_THROTTLES, PROJECT_PASSWORD_THROTTLES, throttle_rejections
 from .serializers import (
     UserSerializer, ProjectSerializer, ProjectDetailSerializer,
-    AssignmentDetailSerializer, LoginSerializer,
-    AssignProjectSerializer, UnlockProjectSerializer
+    AssignmentSerializer, AssignmentDetailSerializer,
+    CompactAssignmentSerializer, NormalizedAssignmentSerializer, ProjectStatsSerializer,
+    LoginSerializer,
+    AssignProjectSerializer, BulkAssignProjectSerializer,
+    UnlockProjectSerializer, BulkUnlockProjectSerializer
 )
 
 
@@ -25,15 +39,21 @@ def api_root(request):
             'staff': '/api/staff/',
             'projects': '/api/projects/',
             'assignments': '/api/assignments/',
+            'assignments_export': '/api/assignments/export/',
+            'stats': '/api/stats/',
             'my_assignments': '/api/my-assignments/',
             'assign_project': '/api/assign-project/',
+            'assign_project_bulk': '/api/assign-project/bulk/',
             'unlock_project': '/api/unlock-project/',
+            'unlock_project_bulk': '/api/unlock-project/bulk/',
+            'metrics': '/api/metrics/',
         }
     })
 
 
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
+@throttle_classes(LOGIN_THROTTLES)
 def login_view(request):
     """Login endpoint - Returns JWT tokens"""
     serializer = LoginSerializer(data=request.data)
@@ -78,9 +98,11 @@ def staff_list(request):
     staff = User.objects.filter(
         role='staff',
         is_active=True
-    ).order_by('username')
+    )
 
-    return Response(UserSerializer(staff, many=True).data)
+    return cached_response(request, lambda: paginated_response(
+        request, staff, UserSerializer, ('username', 'id')
+    ))
 
 
 @api_view(['GET'])
@@ -95,49 +117,202 @@ def projects_list(request):
 
     projects = Project.objects.filter(
         is_active=True
-    ).select_related('organization', 'created_by').order_by('-created_at')
+    )
 
-    return Response(ProjectDetailSerializer(projects, many=True).data)
+    return cached_response(request, lambda: paginated_response(
+        request, projects, ProjectDetailSerializer, ('-created_at', '-id')
+    ))
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def assignments_list(request):
-    """Get all assignments"""
+    """Get all assignments (?view=compact for flat rows, ?view=normalized for side-loaded objects)"""
     if request.user.role != 'admin':
         return Response(
             {'error': 'Only admins can view assignments'}, 
             status=status.HTTP_403_FORBIDDEN
         )
 
-    assignments = Assignment.objects.all().select_related(
+    if request.query_params.get('view') == 'compact':
+        return paginated_response(
+            request,
+            Assignment.objects.values(*CompactAssignmentSerializer.columns),
+            CompactAssignmentSerializer,
+            ('-assigned_at', '-id')
+        )
+
+    if request.query_params.get('view') == 'normalized':
+        return paginated_response(
+            request, Assignment.objects.all(), NormalizedAssignmentSerializer,
+            ('-assigned_at', '-id')
+        )
+
+    assignments = Assignment.objects.all()
+
+    return paginated_response(
+        request, assignments, AssignmentDetailSerializer, ('-assigned_at', '-id')
+    )
+
+
+def _export_lines(assignments, batch_size=100):
+    """Yield NDJSON lines for each assignment, a few rows at a time"""
+    serializer = AssignmentSerializer()
+    encoder = JSONEncoder()
+    lines = []
+    for assignment in assignments.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        lines.append(encoder.encode(serializer.to_representation(assignment)))
+        lines.append('\n')
+        if len(lines) >= batch_size * 2:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def assignments_export(request):
+    """Stream all assignments as NDJSON (one AssignmentSerializer row per line)"""
+    if request.user.role != 'admin':
+        return Response(
+            {'error': 'Only admins can export assignments'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    assignments = Assignment.objects.select_related(
         'staff', 'project', 'assigned_by', 'project__organization'
-    ).order_by('-assigned_at')
+    ).order_by('-assigned_at', '-id')
+
+    organization_id = request.query_params.get('organization')
+    if organization_id is not None:
+        if not organization_id.isdigit():
+            return Response(
+                {'error': 'organization must be an integer id'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        assignments = assignments.filter(project__organization_id=organization_id)
+
+    is_unlocked = request.query_params.get('is_unlocked')
+    if is_unlocked is not None:
+        if is_unlocked not in ('true', 'false'):
+            return Response(
+                {'error': 'is_unlocked must be true or false'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        assignments = assignments.filter(is_unlocked=is_unlocked == 'true')
+
+    response = StreamingHttpResponse(
+        _export_lines(assignments),
+        content_type='application/x-ndjson'
+    )
+    response['Content-Disposition'] = 'attachment; filename="assignments.ndjson"'
+    return response
+
 
-    return Response(AssignmentDetailSerializer(assignments, many=True).data)
+def _stats_data(organization_id=None):
+    """Per-organization totals and per-project rows, all read from ProjectStats"""
+    staff_counts = dict(
+        User.objects.filter(role='staff', is_active=True).order_by()
+        .values_list('organization').annotate(Count('pk'))
+    )
+    totals = {
+        row['project__organization']: row
+        for row in ProjectStats.objects.order_by().values('project__organization').annotate(
+            projects=Count('pk'),
+            assignments=Sum('assignments_count'),
+            unlocked=Sum('unlocked_count'),
+        )
+    }
+
+    organizations = []
+    for organization in Organization.objects.values('id', 'name'):
+        total = totals.get(organization['id'], {})
+        assignments = total.get('assignments') or 0
+        unlocked = total.get('unlocked') or 0
+        organizations.append({
+            **organization,
+            'projects_count': total.get('projects', 0),
+            'staff_count': staff_counts.get(organization['id'], 0),
+            'assignments_count': assignments,
+            'unlocked_count': unlocked,
+            'locked_count': assignments - unlocked,
+        })
+
+    projects = ProjectStats.objects.select_related('project').order_by('project__name', 'pk')
+    if organization_id is not None:
+        projects = projects.filter(project__organization_id=organization_id)
+
+    return {
+        'organizations': organizations,
+        'projects': ProjectStatsSerializer(projects, many=True).data,
+    }
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def stats(request):
+    """Assignment totals per organization and project (?organization=<id> filters projects)"""
+    if request.user.role != 'admin':
+        return Response(
+            {'error': 'Only admins can view stats'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    organization_id = request.query_params.get('organization')
+    if organization_id is not None and not organization_id.isdigit():
+        return Response(
+            {'error': 'organization must be an id'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return cached_response(request, lambda: Response(_stats_data(organization_id)))
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def metrics(request):
+    """In-process counters of the worker that serves this request"""
+    if request.user.role != 'admin':
+        return Response(
+            {'error': 'Only admins can view metrics'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    return Response({
+        'pid': os.getpid(),
+        'password_cache': password_cache_stats(),
+        'throttle_rejections': throttle_rejections(),
+    })
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def my_assignments(request):
-    """Get current user's assignments (for staff)"""
+    """Get current user's assignments (for staff, ?view=normalized for side-loaded objects)"""
     if request.user.role != 'staff':
         return Response(
             {'error': 'Only staff can view their assignments'}, 
             status=status.HTTP_403_FORBIDDEN
         )
 
-    assignments = Assignment.objects.filter(
-        staff=request.user
-    ).select_related(
-        'project', 'assigned_by', 'project__organization'
-    ).order_by('-assigned_at')
+    assignments = Assignment.objects.filter(staff=request.user)
 
-    return Response(AssignmentDetailSerializer(assignments, many=True).data)
+    if request.query_params.get('view') == 'normalized':
+        serializer_class = NormalizedAssignmentSerializer
+    else:
+        serializer_class = AssignmentDetailSerializer
+
+    # Polling clients get a 304 from the aggregate query alone
+    token, last_modified = assignments.change_marker()
+    return conditional_response(request, token, last_modified, lambda: paginated_response(
+        request, assignments, serializer_class, ('-assigned_at', '-id')
+    ))
 
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
+@throttle_classes(PROJECT_PASSWORD_THROTTLES)
 def assign_project(request):
     """Assign project to staff member"""
     if request.user.role != 'admin':
@@ -155,38 +330,50 @@ def assign_project(request):
     project_password = serializer.validated_data['project_password']
     notes = serializer.validated_data.get('notes', '')
 
-    try:
-        staff = User.objects.get(id=staff_id, role='staff')
-        project = Project.objects.get(id=project_id, is_active=True)
-    except User.DoesNotExist:
+    # One query answers both "does the project exist" and "does the staff member"
+    staff_exists = Exists(User.objects.filter(id=staff_id, role='staff'))
+    project = Project.objects.filter(
+        id=project_id, is_active=True
+    ).annotate(staff_exists=staff_exists).only('id', 'password').first()
+
+    if project is None:
+        if not User.objects.filter(id=staff_id, role='staff').exists():
+            return Response(
+                {'error': 'Staff member not found'}, 
+                status=status.HTTP_404_NOT_FOUND
+            )
         return Response(
-            {'error': 'Staff member not found'}, 
+            {'error': 'Project not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
-    except Project.DoesNotExist:
+    if not project.staff_exists:
         return Response(
-            {'error': 'Project not found'}, 
+            {'error': 'Staff member not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
 
-    if not check_password(project_password, project.password):
+    if not check_project_password(project, project_password):
         return Response(
             {'error': 'Invalid project password'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    if Assignment.objects.filter(staff=staff, project=project).exists():
+    # The (staff, project) unique constraint settles concurrent requests
+    try:
+        with transaction.atomic():
+            assignment = Assignment.objects.create(
+                staff_id=staff_id,
+                project=project,
+                assigned_by=request.user,
+                notes=notes
+            )
+    except IntegrityError:
         return Response(
             {'error': 'Project already assigned to this staff member'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    assignment = Assignment.objects.create(
-        staff=staff,
-        project=project,
-        assigned_by=request.user,
-        notes=notes
-    )
+    assignment = Assignment.objects.with_details().get(pk=assignment.pk)
 
     return Response(
         {
@@ -199,6 +386,93 @@ def assign_project(request):
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
+@throttle_classes(PROJECT_PASSWORD_THROTTLES)
+def assign_project_bulk(request):
+    """Assign one project to many staff members in a single transaction"""
+    if request.user.role != 'admin':
+        return Response(
+            {'error': 'Only admins can assign projects'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    serializer = BulkAssignProjectSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    project_id = serializer.validated_data['project_id']
+    project_password = serializer.validated_data['project_password']
+    notes = serializer.validated_data.get('notes', '')
+    staff_ids = list(dict.fromkeys(serializer.validated_data['staff_ids']))
+
+    try:
+        project = Project.objects.get(id=project_id, is_active=True)
+    except Project.DoesNotExist:
+        return Response(
+            {'error': 'Project not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if not check_project_password(project, project_password):
+        return Response(
+            {'error': 'Invalid project password'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    valid_ids = set(
+        User.objects.filter(id__in=staff_ids, role='staff').values_list('id', flat=True)
+    )
+    invalid = [i for i in staff_ids if i not in valid_ids]
+
+    def new_assignments(ids):
+        return [
+            Assignment(staff_id=staff_id, project=project, assigned_by=request.user, notes=notes)
+            for staff_id in ids
+        ]
+
+    with transaction.atomic():
+        assigned_ids = set(
+            Assignment.objects.filter(
+                project=project, staff_id__in=valid_ids
+            ).values_list('staff_id', flat=True)
+        )
+        created = [i for i in staff_ids if i in valid_ids and i not in assigned_ids]
+        try:
+            with transaction.atomic():
+                Assignment.objects.bulk_create(new_assignments(created))
+        except IntegrityError:
+            # A concurrent request assigned some of them first: insert one by
+            # one, so ``created`` lists only the rows this request added
+            inserted = []
+            for staff_id in created:
+                try:
+                    with transaction.atomic():
+                        Assignment.objects.bulk_create(new_assignments([staff_id]))
+                except IntegrityError:
+                    continue
+                inserted.append(staff_id)
+            created = inserted
+        # bulk_create sends no post_save, so recount this project
+        ProjectStats.objects.recount([project.id])
+    created_ids = set(created)
+    skipped = [i for i in staff_ids if i in valid_ids and i not in created_ids]
+
+    # bulk_create sends no post_save, so retire cached lists explicitly
+    bump_generation()
+
+    return Response(
+        {
+            'message': f'Project assigned to {len(created)} staff members',
+            'created': created,
+            'skipped': skipped,
+            'invalid': invalid,
+        },
+        status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    )
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+@throttle_classes(PROJECT_PASSWORD_THROTTLES)
 def unlock_project(request):
     """Unlock project for staff"""
     if request.user.role != 'staff':
@@ -225,7 +499,7 @@ def unlock_project(request):
             status=status.HTTP_404_NOT_FOUND
         )
 
-    if not check_password(project_password, assignment.project.password):
+    if not check_project_password(assignment.project, project_password):
         return Response(
             {'error': 'Invalid project password'}, 
             status=status.HTTP_400_BAD_REQUEST
@@ -248,4 +522,88 @@ def unlock_project(request):
             'assignment': AssignmentDetailSerializer(assignment).data
         },
         status=status.HTTP_200_OK
-    )
\ No newline at end of file
+    )
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+@throttle_classes(PROJECT_PASSWORD_THROTTLES)
+def unlock_project_bulk(request):
+    """Unlock several assignments, checking each project's password once"""
+    if request.user.role != 'staff':
+        return Response(
+            {'error': 'Only staff can unlock projects'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    serializer = BulkUnlockProjectSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    items = serializer.validated_data['items']
+    assignments = Assignment.objects.filter(
+        staff=request.user
+    ).select_related('project').only(
+        'id', 'project', 'is_unlocked', 'project__password'
+    ).in_bulk(
+        [item['assignment_id'] for item in items]
+    )
+
+    # The throttles count this request once, so it may carry only one guess
+    # per project; otherwise one request could try hundreds of passwords
+    passwords = {}
+    for item in items:
+        assignment = assignments.get(item['assignment_id'])
+        if assignment is not None:
+            passwords.setdefault(assignment.project_id, set()).add(item['project_password'])
+    if any(len(guesses) > 1 for guesses in passwords.values()):
+        return Response(
+            {'error': 'Use a single project_password per project'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    verified = {}
+    to_unlock = set()
+    results = []
+    for item in items:
+        assignment_id = item['assignment_id']
+        assignment = assignments.get(assignment_id)
+        if assignment is None:
+            results.append({'assignment_id': assignment_id, 'status': 'not_found'})
+            continue
+
+        key = (assignment.project_id, item['project_password'])
+        if key not in verified:
+            verified[key] = check_project_password(
+                assignment.project, item['project_password']
+            )
+        if not verified[key]:
+            results.append({'assignment_id': assignment_id, 'status': 'invalid_password'})
+        elif assignment.is_unlocked or assignment_id in to_unlock:
+            results.append({'assignment_id': assignment_id, 'status': 'already_unlocked'})
+        else:
+            to_unlock.add(assignment_id)
+            results.append({'assignment_id': assignment_id, 'status': 'unlocked'})
+
+    if to_unlock:
+        now = timezone.now()
+        by_project = {}
+        for assignment_id in to_unlock:
+            by_project.setdefault(assignments[assignment_id].project_id, []).append(assignment_id)
+        # One conditional update per project, so ProjectStats gets exact increments
+        with transaction.atomic():
+            for project_id, ids in by_project.items():
+                unlocked = Assignment.objects.filter(
+                    id__in=ids, is_unlocked=False
+                ).update(is_unlocked=True, unlocked_at=now, updated_at=now)
+                ProjectStats.objects.increment(project_id, unlocked=unlocked)
+        # QuerySet.update sends no post_save, so retire cached lists explicitly
+        bump_generation()
+
+    return Response(
+        {
+            'message': f'Unlocked {len(to_unlock)} assignments',
+            'results': results,
+        },
+        status=status.HTTP_200_OK
+    )
@@ -35,6 +35,18 @@ axios.interceptors.response.use(
   }
 );
 
+// Follow cursor pagination links and collect every page of a list endpoint
+async function fetchAllPages(url) {
+  const results = [];
+  let next = url;
+  while (next) {
+    const response = await axios.get(next);
+    results.push(...response.data.results);
+    next = response.data.next;
+  }
+  return results;
+}
+
 // Spinner Component
 function Spinner() {
   return <div className="loading-spinner"></div>;
@@ -178,15 +190,17 @@ function AdminDashboard() {
   const fetchData = async () => {
     setLoading(true);
     try {
-      const [staffRes, projectsRes, assignmentsRes] = await Promise.all([
-        axios.get(`${API_URL}/staff/`),
-        axios.get(`${API_URL}/projects/`),
-        axios.get(`${API_URL}/assignments/`),
+      const [staffList, projectsList, assignmentsList] = await Promise.all([
+        fetchAllPages(`${API_URL}/staff/?fields=id,username,email,first_name,last_name`),
+        fetchAllPages(`${API_URL}/projects/?fields=id,name,description,assignments_count`),
+        fetchAllPages(
+          `${API_URL}/assignments/?fields=id,staff_username,project_name,is_unlocked,assigned_at,notes`
+        ),
       ]);
 
-      setStaff(staffRes.data);
-      setProjects(projectsRes.data);
-      setAssignments(assignmentsRes.data);
+      setStaff(staffList);
+      setProjects(projectsList);
+      setAssignments(assignmentsList);
     } catch (error) {
       setAlert({
         type: "error",
@@ -447,8 +461,9 @@ function StaffDashboard() {
   const fetchAssignments = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API_URL}/my-assignments/`);
-      setAssignments(response.data);
+      setAssignments(await fetchAllPages(
+        `${API_URL}/my-assignments/?fields=id,project_name,organization_name,assigned_by_username,assigned_at,is_unlocked,unlocked_at,notes`
+      ));
     } catch (error) {
       setAlert({
         type: "error",